@@ -96,12 +96,21 @@ class AbstractFileBasedStreamReader(ABC):
     def file_matches_globs(file: RemoteFile, globs: List[str]) -> bool:
         # Use the GLOBSTAR flag to enable recursive ** matching
         # (https://facelessuser.github.io/wcmatch/wcmatch/#globstar)
-        return any(globmatch(file.uri, g, flags=GLOBSTAR) for g in globs)
+        # Passing all the globs at once lets wcmatch compile and match them as a single (cached) pattern
+        return bool(globmatch(file.uri, globs, flags=GLOBSTAR))
 
     @staticmethod
     def get_prefixes_from_globs(globs: List[str]) -> Set[str]:
         """
         Utility method for extracting prefixes from the globs.
+
+        Listing files under a prefix also lists the files under any longer prefix that starts with it, so prefixes covered by
+        another prefix are dropped to avoid listing the same files more than once.
         """
-        prefixes = {glob.split("*")[0] for glob in globs}
-        return set(filter(lambda x: bool(x), prefixes))
+        prefixes = sorted(filter(lambda x: bool(x), {glob.split("*")[0] for glob in globs}))
+        coalesced_prefixes: List[str] = []
+        for prefix in prefixes:
+            # Prefixes are sorted, so a prefix covering this one is necessarily the last prefix kept
+            if not coalesced_prefixes or not prefix.startswith(coalesced_prefixes[-1]):
+                coalesced_prefixes.append(prefix)
+        return set(coalesced_prefixes)
@@ -59,22 +59,27 @@ class _CsvReader:
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
-            reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
+            # Read rows as lists and zip them with the headers ourselves: comparing the lengths is cheaper than csv.DictReader filling
+            # missing or extra values and then scanning every row for them
+            reader = csv.reader(fp, dialect=dialect_name)  # type: ignore
+            n_headers = len(headers)
             try:
-                for row in reader:
+                for values in reader:
+                    # Skip empty lines the same way csv.DictReader does
+                    if not values:
+                        continue
                     lineno += 1
 
-                    # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
-                    # than headers or more headers dans columns
-                    if None in row:
+                    # The row was not properly parsed if there are more columns than headers or more headers than columns
+                    if len(values) > n_headers:
                         raise RecordParseError(
                             FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_COLUMNS,
                             filename=file.uri,
                             lineno=lineno,
                         )
-                    if None in row.values():
+                    if len(values) < n_headers:
                         raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD_MISMATCHED_ROWS, filename=file.uri, lineno=lineno)
-                    yield row
+                    yield dict(zip(headers, values))
             finally:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
@@ -203,7 +208,8 @@ class CsvParser(FileTypeParser):
     def _to_nullable(
         row: Mapping[str, str], deduped_property_types: Mapping[str, str], null_values: Set[str], strings_can_be_null: bool
     ) -> Dict[str, Optional[str]]:
-        nullable = row | {
+        # Every key of the row is part of the comprehension so there is no need to merge it back into the row
+        nullable = {
             k: None if CsvParser._value_is_none(v, deduped_property_types.get(k), null_values, strings_can_be_null) else v
             for k, v in row.items()
         }
@@ -298,9 +304,8 @@ class CsvParser(FileTypeParser):
                 result[key] = cast_value
 
         if warnings:
-            logger.warning(
-                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
-            )
+            # Use lazy formatting so the message is only built if the warning is actually emitted
+            logger.warning("%s: %s", FileBasedSourceError.ERROR_CASTING_VALUE.value, ",".join(warnings))
         return result
 
 
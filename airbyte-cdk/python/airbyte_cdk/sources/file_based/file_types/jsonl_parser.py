@@ -6,6 +6,7 @@ import json
 import logging
 from typing import Any, Dict, Iterable, Mapping, Optional, Union
 
+import orjson
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
@@ -94,7 +95,8 @@ class JsonlParser(FileTypeParser):
                 read_bytes += len(line)
                 accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
                 try:
-                    record = json.loads(accumulator)
+                    # Once a multiline object was found, accumulated lines are mostly partial objects that orjson would reject anyway
+                    record = json.loads(accumulator) if had_json_parsing_error else self._parse_json(accumulator)
                     if had_json_parsing_error and not has_warned_for_multiline_json_object:
                         logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
                         has_warned_for_multiline_json_object = True
@@ -115,6 +117,17 @@ class JsonlParser(FileTypeParser):
             if had_json_parsing_error and not yielded_at_least_once:
                 raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
 
+    @staticmethod
+    def _parse_json(value: Union[bytes, str]) -> Any:
+        """
+        Decode a complete line with orjson which is significantly faster than the standard library. Lines orjson rejects but json
+        accepts (NaN, integers wider than 64 bits, non UTF-8 encodings) are decoded with json so the output is the same as before.
+        """
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return json.loads(value)
+
     @staticmethod
     def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
         if isinstance(line, bytes):
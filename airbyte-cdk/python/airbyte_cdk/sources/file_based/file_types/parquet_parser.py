@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -59,18 +60,18 @@ class ParquetParser(FileTypeParser):
             logger.info(f"Expected ParquetFormat, got {parquet_format}")
             raise ConfigValidationError(FileBasedSourceError.CONFIG_VALIDATION_ERROR)
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
-            reader = pq.ParquetFile(fp)
+            # Pre-buffering coalesces the reads of the column chunks of a row group into fewer, larger requests against the remote file
+            reader = pq.ParquetFile(fp, pre_buffer=True)
             partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-            for row_group in range(reader.num_row_groups):
-                batch = reader.read_row_group(row_group)
-                for row in range(batch.num_rows):
-                    yield {
-                        **{
-                            column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                            for column in batch.column_names
-                        },
-                        **partition_columns,
-                    }
+            for batch in reader.iter_batches(use_threads=True):
+                # Convert each column to python values in a single call instead of materializing one pyarrow scalar per cell
+                columns_values = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                rows = zip(*columns_values) if columns_values else itertools.repeat((), batch.num_rows)
+                names = batch.schema.names
+                for row in rows:
+                    record = dict(zip(names, row))
+                    record.update(partition_columns)
+                    yield record
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -85,26 +86,6 @@ class ParquetParser(FileTypeParser):
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        # Convert date and datetime objects to isoformat strings
-        if pa.types.is_time(parquet_value.type) or pa.types.is_timestamp(parquet_value.type) or pa.types.is_date(parquet_value.type):
-            return parquet_value.as_py().isoformat()
-
-        # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
-
-        # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            py_value = parquet_value.as_py()
-            if py_value is None:
-                return py_value
-            return py_value.decode("utf-8")
-        if pa.types.is_decimal(parquet_value.type):
-            if parquet_format.decimal_as_float:
-                return parquet_value.as_py()
-            else:
-                return str(parquet_value.as_py())
-
         # Dictionaries are stored as two columns: indices and values
         # The indices column is an array of integers that maps to the values column
         if pa.types.is_dictionary(parquet_value.type):
@@ -112,28 +93,68 @@ class ParquetParser(FileTypeParser):
                 "indices": parquet_value.indices.tolist(),
                 "values": parquet_value.dictionary.tolist(),
             }
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
 
-        if pa.types.is_null(parquet_value.type):
+        py_value = parquet_value.as_py()
+        if py_value is None:
             return None
+        return ParquetParser._get_value_converter(parquet_value.type, parquet_format)(py_value)
+
+    @staticmethod
+    def _to_output_values(parquet_column: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a pyarrow array to a list of values that can be output by the source.
+        """
+        if pa.types.is_dictionary(parquet_column.type):
+            # Dictionary-encoded columns (e.g. categoricals written by pandas) are output as their decoded values
+            parquet_column = parquet_column.dictionary_decode()
+
+        converter = ParquetParser._get_value_converter(parquet_column.type, parquet_format)
+        if parquet_column.null_count == 0:
+            # Most columns (ids, timestamps, required fields) have no nulls, so the per-value null check can be skipped entirely
+            if converter is _identity:
+                return parquet_column.to_pylist()  # type: ignore  # pyarrow is untyped
+            return [converter(py_value) for py_value in parquet_column.to_pylist()]
+        return [None if py_value is None else converter(py_value) for py_value in parquet_column.to_pylist()]
+
+    @staticmethod
+    def _get_value_converter(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Callable[[Any], Any]:
+        """
+        Return the function converting a non-null python value of the given pyarrow type to a value that can be output by the source.
+        The type is dispatched on once per column rather than once per value.
+        """
+        # Convert date and datetime objects to isoformat strings
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return lambda py_value: py_value.isoformat()
+
+        # Convert month_day_nano_interval to array
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda py_value: json.loads(json.dumps(py_value))
+
+        # Decode binary strings to utf-8
+        if ParquetParser._is_binary(parquet_type):
+            return lambda py_value: py_value.decode("utf-8")
+
+        if pa.types.is_decimal(parquet_type):
+            return _identity if parquet_format.decimal_as_float else str
+
+        if pa.types.is_map(parquet_type):
+            return lambda py_value: {k: v for k, v in py_value}
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            unit = parquet_type.unit
+            if unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif unit == "ns":
+                return lambda duration: duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {unit}")
+
+        return _identity
 
     @staticmethod
     def parquet_type_to_schema_type(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Mapping[str, str]:
@@ -199,3 +220,7 @@ class ParquetParser(FileTypeParser):
     @staticmethod
     def _is_list(parquet_type: pa.DataType) -> bool:
         return bool(pa.types.is_list(parquet_type) or pa.types.is_large_list(parquet_type) or parquet_type == pa.month_day_nano_interval())
+
+
+def _identity(value: Any) -> Any:
+    return value
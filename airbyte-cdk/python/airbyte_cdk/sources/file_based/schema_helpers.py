@@ -165,13 +165,13 @@ def conforms_to_schema(record: Mapping[str, Any], schema: Mapping[str, Any]) ->
     - For every column in the record, that column's type is equal to or narrower than the same column's
       type in the schema.
     """
-    schema_columns = set(schema.get("properties", {}).keys())
-    record_columns = set(record.keys())
+    properties = schema.get("properties", {})
 
-    if not record_columns.issubset(schema_columns):
+    # Compare the keys views directly to avoid building two sets for every record
+    if not record.keys() <= properties.keys():
         return False
 
-    for column, definition in schema.get("properties", {}).items():
+    for column, definition in properties.items():
         expected_type = definition.get("type")
         value = record.get(column)
 
@@ -133,6 +133,14 @@ class AbstractFileBasedStream(Stream):
         ...
 
     def get_parser(self) -> FileTypeParser:
+        return self._parser
+
+    @cached_property
+    def _parser(self) -> FileTypeParser:
+        """
+        The stream only supports a single file type, so the parser is resolved once and reused for every file
+        instead of being looked up again on each read and schema inference task.
+        """
         try:
             return self._parsers[type(self.config.format)]
         except KeyError:
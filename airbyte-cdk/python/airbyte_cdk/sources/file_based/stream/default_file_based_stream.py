@@ -3,11 +3,12 @@
 #
 
 import asyncio
+import heapq
 import itertools
 import traceback
 from copy import deepcopy
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -81,6 +82,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
+        # Resolve the attributes used for every record once per slice instead of once per record
+        stream_name = self.name
+        schemaless = self.config.schemaless
+        record_passes_validation_policy = self.record_passes_validation_policy
         for file in stream_slice["files"]:
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
@@ -89,14 +94,14 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             try:
                 for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
                     line_no += 1
-                    if self.config.schemaless:
+                    if schemaless:
                         record = {"data": record}
-                    elif not self.record_passes_validation_policy(record):
+                    elif not record_passes_validation_policy(record):
                         n_skipped += 1
                         continue
                     record[self.ab_last_mod_col] = file_datetime_string
                     record[self.ab_file_name_col] = file.uri
-                    yield stream_data_to_airbyte_message(self.name, record)
+                    yield stream_data_to_airbyte_message(stream_name, record)
                 self._cursor.add_file(file)
 
             except StopSyncPerValidationPolicy:
@@ -181,7 +186,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             max_n_files_for_schema_inference = self._discovery_policy.get_max_n_files_for_schema_inference(self.get_parser())
             if total_n_files > max_n_files_for_schema_inference:
                 # Use the most recent files for schema inference, so we pick up schema changes during discovery.
-                files = sorted(files, key=lambda x: x.last_modified, reverse=True)[:max_n_files_for_schema_inference]
+                files = heapq.nlargest(max_n_files_for_schema_inference, files, key=lambda x: x.last_modified)
                 self.logger.warn(
                     msg=f"Refusing to infer schema for all {total_n_files} files; using {max_n_files_for_schema_inference} files."
                 )
@@ -206,8 +211,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         return self.stream_reader.get_matching_files(self.config.globs or [], self.config.legacy_prefix, self.logger)
 
     def infer_schema(self, files: List[RemoteFile]) -> Mapping[str, Any]:
-        loop = asyncio.get_event_loop()
-        schema = loop.run_until_complete(self._infer_schema(files))
+        schema = asyncio.run(self._infer_schema(files))
         # as infer schema returns a Mapping that is assumed to be immutable, we need to create a deepcopy to avoid modifying the reference
         return self._fill_nulls(deepcopy(schema))
 
@@ -235,21 +239,26 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         Each file type has a corresponding `infer_schema` handler.
         Dispatch on file type.
         """
+        semaphore = asyncio.Semaphore(self._discovery_policy.n_concurrent_requests)
+
+        async def _infer_file_schema_with_limit(file: RemoteFile) -> SchemaType:
+            async with semaphore:
+                try:
+                    return await self._infer_file_schema(file)
+                except Exception as exc:
+                    self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
+                    return {}
+
+        # The semaphore bounds the number of concurrent requests sent to the source
+        results = await asyncio.gather(*(_infer_file_schema_with_limit(file) for file in files))
+
         base_schema: SchemaType = {}
-        pending_tasks: Set[asyncio.tasks.Task[SchemaType]] = set()
-
-        n_started, n_files = 0, len(files)
-        files_iterator = iter(files)
-        while pending_tasks or n_started < n_files:
-            while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
-                pending_tasks.add(asyncio.create_task(self._infer_file_schema(file)))
-                n_started += 1
-            # Return when the first task is completed so that we can enqueue a new task as soon as the
-            # number of concurrent tasks drops below the number allowed.
-            done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-            for task in done:
+        for result in results:
+            # Files of a stream usually share the same schema. The accumulated schema has already been validated by
+            # merge_schemas, so identical or empty schemas can be skipped without copying and re-validating it.
+            if result and result != base_schema:
                 try:
-                    base_schema = merge_schemas(base_schema, task.result())
+                    base_schema = merge_schemas(base_schema, result)
                 except Exception as exc:
                     self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
 
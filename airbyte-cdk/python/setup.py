@@ -16,6 +16,7 @@ README = (HERE / "README.md").read_text()
 avro_dependency = "avro~=1.11.2"
 fastavro_dependency = "fastavro~=1.8.0"
 pyarrow_dependency = "pyarrow==12.0.1"
+orjson_dependency = "orjson~=3.9"
 
 langchain_dependency = "langchain==0.0.271"
 openai_dependency = "openai[embeddings]==0.27.9"
@@ -98,6 +99,7 @@ setup(
             "pytest-httpserver",
             "pandas==2.0.3",
             pyarrow_dependency,
+            orjson_dependency,
             langchain_dependency,
             openai_dependency,
             cohere_dependency,
@@ -112,6 +114,7 @@ setup(
             avro_dependency,
             fastavro_dependency,
             pyarrow_dependency,
+            orjson_dependency,
             *unstructured_dependencies,
         ],
         "vector-db-based": [langchain_dependency, openai_dependency, cohere_dependency, tiktoken_dependency],
@@ -495,6 +495,24 @@ class CsvReaderTest(unittest.TestCase):
             next(data_generator)
         assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
 
+    def test_given_empty_lines_when_read_data_then_skip_them(self) -> None:
+        self._stream_reader.open_file.return_value = (
+            CsvFileBuilder()
+            .with_data(
+                [
+                    "header1,header2",
+                    "value11,value12",
+                    "",
+                    "value21,value22",
+                ]
+            )
+            .build()
+        )
+
+        data_generator = self._read_data()
+
+        assert list(data_generator) == [{"header1": "value11", "header2": "value12"}, {"header1": "value21", "header2": "value22"}]
+
     def _read_data(self) -> Generator[Dict[str, str], None, None]:
         data_generator = self._csv_reader.read_data(
             self._config,
@@ -525,8 +543,7 @@ def test_encoding_is_passed_to_stream_reader() -> None:
     )
 
     mock_obj.__enter__ = Mock(return_value=io.StringIO("c1,c2\nv1,v2"))
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+    asyncio.run(parser.infer_schema(config, file, stream_reader, logger))
     stream_reader.open_file.assert_called_with(file, FileReadMode.READ, encoding, logger)
     stream_reader.open_file.assert_has_calls(
         [
@@ -5,6 +5,7 @@
 import asyncio
 import io
 import json
+import math
 from typing import Any, Dict
 from unittest.mock import MagicMock, Mock
 
@@ -134,6 +135,13 @@ def test_given_one_json_per_line_when_parse_records_then_do_not_send_warning(str
     assert logger.warning.call_count == 0
 
 
+def test_given_values_not_supported_by_orjson_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = [b'{"a": NaN, "b": 123456789012345678901234567890}']
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert math.isnan(records[0]["a"])
+    assert records[0]["b"] == 123456789012345678901234567890
+
+
 def test_given_multiline_json_object_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
     stream_reader.open_file.return_value.__enter__.return_value = JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS
     records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
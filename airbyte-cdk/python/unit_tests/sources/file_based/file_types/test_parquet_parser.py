@@ -4,11 +4,14 @@
 
 import asyncio
 import datetime
+import decimal
+import io
 import math
-from typing import Any, Mapping, Union
+from typing import Any, List, Mapping, Optional, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -226,4 +229,83 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     stream_reader = Mock()
     logger = Mock()
     with pytest.raises(ValueError):
-        asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+        asyncio.run(parser.infer_schema(config, file, stream_reader, logger))
+
+
+@pytest.mark.parametrize(
+    "discovered_schema, schemaless, expected_records",
+    [
+        pytest.param(
+            {"type": "object", "properties": {"col1": {"type": "string"}, "_ab_source_file_url": {"type": "string"}}},
+            False,
+            [{"col1": "val11", "col2": "val12"}, {"col1": "val21", "col2": "val22"}],
+            id="test_columns_outside_schema_are_read",
+        ),
+        pytest.param(None, False, [{"col1": "val11", "col2": "val12"}, {"col1": "val21", "col2": "val22"}], id="test_no_schema"),
+        pytest.param(
+            {"type": "object", "properties": {"data": {"type": "object"}}},
+            True,
+            [{"col1": "val11", "col2": "val12"}, {"col1": "val21", "col2": "val22"}],
+            id="test_schemaless",
+        ),
+    ],
+)
+def test_parse_records_reads_all_columns(
+    discovered_schema: Optional[Mapping[str, Any]], schemaless: bool, expected_records: List[Mapping[str, Any]]
+) -> None:
+    buffer = io.BytesIO()
+    pq.write_table(pa.table({"col1": ["val11", "val21"], "col2": ["val12", "val22"]}), buffer)
+    buffer.seek(0)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=buffer)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = Mock()
+    config.format = _default_parquet_format
+    config.schemaless = schemaless
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+
+    records = list(ParquetParser().parse_records(config, file, stream_reader, Mock(), discovered_schema))
+
+    assert records == expected_records
+
+
+@pytest.mark.parametrize(
+    "pyarrow_type, parquet_values, expected_values",
+    [
+        pytest.param(pa.int64(), [1, None, 3], [1, None, 3], id="test_int64"),
+        pytest.param(pa.int64(), [1, 2, 3], [1, 2, 3], id="test_int64_without_nulls"),
+        pytest.param(pa.binary(), [b"hello", None], ["hello", None], id="test_binary"),
+        pytest.param(pa.binary(), [b"hello", b"world"], ["hello", "world"], id="test_binary_without_nulls"),
+        pytest.param(pa.date32(), [datetime.date(2021, 1, 1), None], ["2021-01-01", None], id="test_date32"),
+        pytest.param(pa.decimal128(5, 2), [decimal.Decimal("13.00"), None], ["13.00", None], id="test_decimal_as_string"),
+        pytest.param(pa.duration("ms"), [12345, None], [12345, None], id="test_duration_ms"),
+        pytest.param(pa.map_(pa.string(), pa.int32()), [{"hello": 1}, None], [{"hello": 1}, None], id="test_map"),
+    ],
+)
+def test_column_transformation(pyarrow_type: pa.DataType, parquet_values: List[Any], expected_values: List[Any]) -> None:
+    parquet_column = pa.array(parquet_values, type=pyarrow_type)
+    assert ParquetParser._to_output_values(parquet_column, _default_parquet_format) == expected_values
+
+
+def test_parse_records_with_dictionary_encoded_column() -> None:
+    buffer = io.BytesIO()
+    fruits = pa.array(["apple", "banana", None, "apple"]).dictionary_encode()
+    timestamps = pa.array([datetime.datetime(2021, 1, 1), None, None, datetime.datetime(2021, 1, 1)]).dictionary_encode()
+    pq.write_table(pa.table({"fruit": fruits, "timestamp": timestamps}), buffer)
+    buffer.seek(0)
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=buffer)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = Mock()
+    config.format = _default_parquet_format
+    config.schemaless = False
+    file = RemoteFile(uri="s3://mybucket/test.parquet", last_modified=datetime.datetime.now())
+
+    records = list(ParquetParser().parse_records(config, file, stream_reader, Mock(), None))
+
+    assert records == [
+        {"fruit": "apple", "timestamp": "2021-01-01T00:00:00"},
+        {"fruit": "banana", "timestamp": None},
+        {"fruit": None, "timestamp": None},
+        {"fruit": "apple", "timestamp": "2021-01-01T00:00:00"},
+    ]
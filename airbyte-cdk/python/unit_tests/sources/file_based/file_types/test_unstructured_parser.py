@@ -60,11 +60,6 @@ FILE_URI = "path/to/file.xyz"
 )
 @patch("airbyte_cdk.sources.file_based.file_types.unstructured_parser.detect_filetype")
 def test_infer_schema(mock_detect_filetype, filetype, format_config, raises):
-    # use a fresh event loop to avoid leaking into other tests
-    main_loop = asyncio.get_event_loop()
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
     stream_reader = MagicMock()
     mock_open(stream_reader.open_file)
     fake_file = MagicMock()
@@ -75,15 +70,13 @@ def test_infer_schema(mock_detect_filetype, filetype, format_config, raises):
     config.format = format_config
     if raises:
         with pytest.raises(RecordParseError):
-            loop.run_until_complete(UnstructuredParser().infer_schema(config, fake_file, stream_reader, logger))
+            asyncio.run(UnstructuredParser().infer_schema(config, fake_file, stream_reader, logger))
     else:
-        schema = loop.run_until_complete(UnstructuredParser().infer_schema(config, MagicMock(), MagicMock(), MagicMock()))
+        schema = asyncio.run(UnstructuredParser().infer_schema(config, MagicMock(), MagicMock(), MagicMock()))
         assert schema == {
             "content": {"type": "string"},
             "document_key": {"type": "string"},
         }
-    loop.close()
-    asyncio.set_event_loop(main_loop)
 
 
 @pytest.mark.parametrize(
@@ -2,19 +2,28 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
+import io
 import unittest
 from datetime import datetime, timezone
-from typing import Any, Iterable, Iterator, Mapping
-from unittest.mock import Mock
+from typing import Any, Iterable, Iterator, List, Mapping, Optional
+from unittest.mock import Mock, patch
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
-from airbyte_cdk.models import Level
+from airbyte_cdk.models import Level, Type
 from airbyte_cdk.sources.file_based.availability_strategy import AbstractFileBasedAvailabilityStrategy
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import ValidationPolicy
+from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
+from airbyte_cdk.sources.file_based.exceptions import UndefinedParserError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.file_types.parquet_parser import ParquetParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
-from airbyte_cdk.sources.file_based.schema_validation_policies import AbstractSchemaValidationPolicy
+from airbyte_cdk.sources.file_based.schema_helpers import merge_schemas
+from airbyte_cdk.sources.file_based.schema_validation_policies import DEFAULT_SCHEMA_VALIDATION_POLICIES, AbstractSchemaValidationPolicy
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
 from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DefaultFileBasedStream
 
@@ -63,6 +72,51 @@ def test_fill_nulls(input_schema: Mapping[str, Any], expected_output: Mapping[st
     assert DefaultFileBasedStream._fill_nulls(input_schema) == expected_output
 
 
+@pytest.mark.parametrize(
+    "validation_policy, expected_records, expected_log_level",
+    [
+        pytest.param(
+            ValidationPolicy.emit_record,
+            [{"col1": "a", "new_col": 1}, {"col1": "b", "new_col": 2}],
+            None,
+            id="emit_record_emits_columns_outside_schema",
+        ),
+        pytest.param(ValidationPolicy.skip_record, [], Level.WARN, id="skip_record_skips_records_with_columns_outside_schema"),
+        pytest.param(ValidationPolicy.wait_for_discover, [], Level.WARN, id="wait_for_discover_stops_on_columns_outside_schema"),
+    ],
+)
+def test_parquet_columns_outside_catalog_schema_are_validated(
+    validation_policy: ValidationPolicy, expected_records: List[Mapping[str, Any]], expected_log_level: Optional[Level]
+) -> None:
+    buffer = io.BytesIO()
+    pq.write_table(pa.table({"col1": ["a", "b"], "new_col": [1, 2]}), buffer)
+    buffer.seek(0)
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=buffer)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    config = Mock()
+    config.name = "a stream name"
+    config.format = ParquetFormat()
+    config.schemaless = False
+    config.validation_policy = validation_policy
+    stream = DefaultFileBasedStream(
+        config=config,
+        catalog_schema={"type": "object", "properties": {"col1": {"type": "string"}}},
+        stream_reader=stream_reader,
+        availability_strategy=Mock(spec=AbstractFileBasedAvailabilityStrategy),
+        discovery_policy=Mock(spec=AbstractDiscoveryPolicy),
+        parsers={ParquetFormat: ParquetParser()},
+        validation_policy=DEFAULT_SCHEMA_VALIDATION_POLICIES[validation_policy],
+        cursor=Mock(spec=AbstractFileBasedCursor),
+    )
+
+    messages = list(stream.read_records_from_slice({"files": [RemoteFile(uri="file.parquet", last_modified=datetime.now())]}))
+
+    records = [message.record.data for message in messages if message.type == Type.RECORD]
+    assert [{k: v for k, v in record.items() if not k.startswith("_ab_")} for record in records] == expected_records
+    assert [message.log.level for message in messages if message.type == Type.LOG] == ([expected_log_level] if expected_log_level else [])
+
+
 class DefaultFileBasedStreamTest(unittest.TestCase):
     _NOW = datetime(2022, 10, 22, tzinfo=timezone.utc)
     _A_RECORD = {"a_record": 1}
@@ -159,6 +213,59 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_files_with_same_schema_when_infer_schema_then_merge_once(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 2
+        self._parser.infer_schema.return_value = {"data": {"type": "string"}}
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(5)]
+
+        with patch("airbyte_cdk.sources.file_based.stream.default_file_based_stream.merge_schemas", side_effect=merge_schemas) as merge:
+            schema = self._stream.infer_schema(files)
+
+        assert schema == {"data": {"type": ["null", "string"]}}
+        assert merge.call_count == 1
+
+    def test_infer_schema_runs_at_most_n_concurrent_requests(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 3
+        n_running = peak_n_running = 0
+
+        async def _infer_schema(*args: Any) -> Mapping[str, Any]:
+            nonlocal n_running, peak_n_running
+            n_running += 1
+            peak_n_running = max(peak_n_running, n_running)
+            await asyncio.sleep(0.01)
+            n_running -= 1
+            return {"data": {"type": "string"}}
+
+        self._parser.infer_schema.side_effect = _infer_schema
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(10)]
+
+        schema = self._stream.infer_schema(files)
+
+        assert schema == {"data": {"type": ["null", "string"]}}
+        assert self._parser.infer_schema.call_count == 10
+        assert peak_n_running == 3
+
+    def test_given_error_in_one_file_when_infer_schema_then_infer_from_other_files(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 2
+        self._parser.infer_schema.side_effect = [ValueError("An error"), {"data": {"type": "string"}}]
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(2)]
+
+        schema = self._stream.infer_schema(files)
+
+        assert schema == {"data": {"type": ["null", "string"]}}
+
+    def test_given_unknown_format_when_get_parser_then_raise(self) -> None:
+        self._stream_config.format = Mock()
+
+        with pytest.raises(UndefinedParserError):
+            self._stream.get_parser()
+
+    def test_parser_is_resolved_once(self) -> None:
+        parser = self._stream.get_parser()
+        self._stream._parsers = {}
+
+        assert self._stream.get_parser() is parser is self._parser
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
@@ -243,7 +243,9 @@ class TestSpec(AbstractFileBasedSpec):
         pytest.param(
             ["a/*.csv", "a/*/*.csv"], DEFAULT_CONFIG, {"a/b.csv", "a/c.csv", "a/b/c.csv", "a/c/c.csv"}, {"a/"}, id="a/*.csv,a/*/*.csv"
         ),
-        pytest.param(["a/*.csv", "a/b/*.csv"], DEFAULT_CONFIG, {"a/b.csv", "a/c.csv", "a/b/c.csv"}, {"a/", "a/b/"}, id="a/*.csv,a/b/*.csv"),
+        pytest.param(["a/*.csv", "a/b/*.csv"], DEFAULT_CONFIG, {"a/b.csv", "a/c.csv", "a/b/c.csv"}, {"a/"}, id="a/*.csv,a/b/*.csv"),
+        pytest.param(["a/b/*.csv", "a/c/*.csv"], DEFAULT_CONFIG, {"a/b/c.csv", "a/c/c.csv"}, {"a/b/", "a/c/"}, id="a/b/*.csv,a/c/*.csv"),
+        pytest.param(["a/b/c/*.csv", "a/b*.csv"], DEFAULT_CONFIG, {"a/b/c/d.csv", "a/b.csv"}, {"a/b"}, id="a/b/c/*.csv,a/b*.csv"),
         pytest.param(
             ["**/*.csv"],
             {"start_date": "2023-06-01T03:54:07.000Z", "streams": []},
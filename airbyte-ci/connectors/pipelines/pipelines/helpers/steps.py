@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Tuple, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple, Union
 
 import asyncer
 from pipelines.models.steps import Step, StepStatus
@@ -16,47 +16,58 @@ if TYPE_CHECKING:
 
 
 async def run_steps(
-    steps_and_run_args: List[Union[Step, Tuple[Step, Tuple]] | List[Union[Step, Tuple[Step, Tuple]]]], results: List[StepResult] = []
+    steps_and_run_args: List[Union[Step, Tuple[Step, Tuple]] | List[Union[Step, Tuple[Step, Tuple]]]],
+    results: Optional[List[StepResult]] = None,
 ) -> List[StepResult]:
     """Run multiple steps sequentially, or in parallel if steps are wrapped into a sublist.
 
     Args:
         steps_and_run_args (List[Union[Step, Tuple[Step, Tuple]] | List[Union[Step, Tuple[Step, Tuple]]]]): List of steps to run, if steps are wrapped in a sublist they will be executed in parallel. run function arguments can be passed as a tuple along the Step instance.
-        results (List[StepResult], optional): List of step results, used for recursion.
+        results (List[StepResult], optional): List of step results of previously run steps.
 
     Returns:
         List[StepResult]: List of step results.
     """
-    # If there are no steps to run, return the results
-    if not steps_and_run_args:
-        return results
-
-    # If any of the previous steps failed, skip the remaining steps
-    if any(result.status is StepStatus.FAILURE for result in results):
-        skipped_results = []
-        for step_and_run_args in steps_and_run_args:
-            if isinstance(step_and_run_args, Tuple):
-                skipped_results.append(step_and_run_args[0].skip())
-            else:
-                skipped_results.append(step_and_run_args.skip())
-        return results + skipped_results
-
-    # Pop the next step to run
-    steps_to_run, remaining_steps = steps_and_run_args[0], steps_and_run_args[1:]
-
-    # wrap the step in a list if it is not already (allows for parallel steps)
-    if not isinstance(steps_to_run, list):
-        steps_to_run = [steps_to_run]
-
-    async with asyncer.create_task_group() as task_group:
-        tasks = []
-        for step in steps_to_run:
-            if isinstance(step, Step):
-                tasks.append(task_group.soonify(step.run)())
-            elif isinstance(step, Tuple) and isinstance(step[0], Step) and isinstance(step[1], Tuple):
-                step, run_args = step
-                tasks.append(task_group.soonify(step.run)(*run_args))
+    # Copy the results so that the list passed by the caller is never mutated
+    results = [] if results is None else list(results)
+    # Track failures incrementally so that only the results of the latest batch of steps are checked
+    has_failure = any(result.status is StepStatus.FAILURE for result in results)
+
+    for steps_to_run in _normalize_steps_and_run_args(steps_and_run_args):
+        # If any of the previous steps failed, skip the remaining steps
+        if has_failure:
+            results.extend(step.skip() for step, _ in steps_to_run)
+            continue
+
+        async with asyncer.create_task_group() as task_group:
+            tasks = [task_group.soonify(step.run)(*run_args) for step, run_args in steps_to_run]
+
+        new_results = [task.value for task in tasks]
+        has_failure = any(result.status is StepStatus.FAILURE for result in new_results)
+        results.extend(new_results)
+
+    return results
 
-    new_results = [task.value for task in tasks]
 
-    return await run_steps(remaining_steps, results + new_results)
+def _normalize_steps_and_run_args(
+    steps_and_run_args: List[Union[Step, Tuple[Step, Tuple]] | List[Union[Step, Tuple[Step, Tuple]]]]
+) -> Iterator[List[Tuple[Step, Tuple]]]:
+    """Normalize each sequential entry of the steps to run into a list of (step, run_args) pairs, to run in parallel.
+
+    Args:
+        steps_and_run_args (List[Union[Step, Tuple[Step, Tuple]] | List[Union[Step, Tuple[Step, Tuple]]]]): List of steps to run, as passed to run_steps.
+
+    Yields:
+        List[Tuple[Step, Tuple]]: The steps to run in parallel with their run function arguments.
+    """
+    for steps_to_run in steps_and_run_args:
+        # wrap the step in a list if it is not already (allows for parallel steps)
+        if not isinstance(steps_to_run, list):
+            steps_to_run = [steps_to_run]
+        normalized_steps_to_run = []
+        for step in steps_to_run:
+            if isinstance(step, Step):
+                normalized_steps_to_run.append((step, ()))
+            elif isinstance(step, tuple) and isinstance(step[0], Step) and isinstance(step[1], tuple):
+                normalized_steps_to_run.append(step)
+        yield normalized_steps_to_run
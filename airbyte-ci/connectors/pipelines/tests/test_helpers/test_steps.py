@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from types import SimpleNamespace
+
+import pytest
+from pipelines.helpers.steps import run_steps
+from pipelines.models.steps import Step, StepResult, StepStatus
+
+pytestmark = [
+    pytest.mark.anyio,
+]
+
+
+class SuccessfulStep(Step):
+    title = "Successful step"
+
+    async def _run(self, *args) -> StepResult:
+        self.context.run_calls.append((self, args))
+        return StepResult(self, StepStatus.SUCCESS)
+
+
+class FailingStep(Step):
+    title = "Failing step"
+
+    async def _run(self, *args) -> StepResult:
+        self.context.run_calls.append((self, args))
+        return StepResult(self, StepStatus.FAILURE)
+
+
+@pytest.fixture
+def context():
+    return SimpleNamespace(pipeline_name="test", secrets_to_mask=[], run_calls=[])
+
+
+async def test_run_steps_sequentially_and_in_parallel(context):
+    first, second, third, fourth = (SuccessfulStep(context) for _ in range(4))
+
+    results = await run_steps([first, [second, third], fourth])
+
+    assert [result.step for result in results] == [first, second, third, fourth]
+    assert all(result.status is StepStatus.SUCCESS for result in results)
+    assert context.run_calls[0][0] is first
+    assert {step for step, _ in context.run_calls[1:3]} == {second, third}
+    assert context.run_calls[3][0] is fourth
+
+
+async def test_run_steps_passes_run_args(context):
+    first, second, third = (SuccessfulStep(context) for _ in range(3))
+
+    await run_steps([(first, ("a", "b")), [second, (third, ("c",))]])
+
+    assert dict(context.run_calls) == {first: ("a", "b"), second: (), third: ("c",)}
+
+
+async def test_run_steps_skips_all_steps_after_a_failure(context):
+    first, failing, parallel_step = SuccessfulStep(context), FailingStep(context), SuccessfulStep(context)
+    sequential_step, second_parallel_step, last = (SuccessfulStep(context) for _ in range(3))
+
+    results = await run_steps([first, [failing, parallel_step], sequential_step, [(second_parallel_step, ("a",)), last]])
+
+    assert [result.step for result in results] == [first, failing, parallel_step, sequential_step, second_parallel_step, last]
+    assert [result.status for result in results] == [
+        StepStatus.SUCCESS,
+        StepStatus.FAILURE,
+        StepStatus.SUCCESS,
+        StepStatus.SKIPPED,
+        StepStatus.SKIPPED,
+        StepStatus.SKIPPED,
+    ]
+    assert {step for step, _ in context.run_calls} == {first, failing, parallel_step}
+
+
+async def test_run_steps_skips_all_steps_when_previous_results_failed(context):
+    previous_result = StepResult(FailingStep(context), StepStatus.FAILURE)
+    step = SuccessfulStep(context)
+
+    results = await run_steps([step], results=[previous_result])
+
+    assert len(results) == 2
+    assert results[0] is previous_result
+    assert results[1].step is step
+    assert results[1].status is StepStatus.SKIPPED
+    assert context.run_calls == []
+
+
+async def test_run_steps_does_not_mutate_results_passed_by_caller(context):
+    previous_result = StepResult(SuccessfulStep(context), StepStatus.SUCCESS)
+    previous_results = [previous_result]
+    step = SuccessfulStep(context)
+
+    results = await run_steps([step], results=previous_results)
+
+    assert previous_results == [previous_result]
+    assert [result.step for result in results] == [previous_result.step, step]
+
+
+async def test_run_steps_default_results_are_not_shared_between_calls(context):
+    first, second = SuccessfulStep(context), SuccessfulStep(context)
+
+    first_results = await run_steps([first])
+    second_results = await run_steps([second])
+
+    assert [result.step for result in first_results] == [first]
+    assert [result.step for result in second_results] == [second]